@@ -14,9 +14,10 @@ Author: Zane Hambly, 2025
 License: MIT
 """
 
-from dataclasses import dataclass
+from dataclasses import InitVar, dataclass, field
+from functools import lru_cache
+import re
 from typing import List, Optional, Tuple
-import struct
 
 
 # =============================================================================
@@ -51,6 +52,42 @@ BAUDOT_FIGS = {
 LTRS_DECODE = {v: k for k, v in BAUDOT_LTRS.items()}
 FIGS_DECODE = {v: k for k, v in BAUDOT_FIGS.items()}
 
+# Byte translation tables for bulk encoding, indexed by character code
+# (0xFF where a character has no code in that shift)
+LTRS_TABLE = bytes(BAUDOT_LTRS.get(chr(i), 0xFF) for i in range(256))
+FIGS_TABLE = bytes(BAUDOT_FIGS.get(chr(i), 0xFF) for i in range(256))
+
+# Characters with no Baudot code at all, dropped before translation
+_UNENCODABLE = bytes(
+    i for i in range(256) if LTRS_TABLE[i] == 0xFF and FIGS_TABLE[i] == 0xFF
+)
+
+# A run of text sent in figures: characters only found in FIGS
+# (space, CR and LF are in both shifts, and are sent in letters)
+_FIGS_RUN = re.compile(b'([' + re.escape(bytes(
+    ord(ch) for ch in BAUDOT_FIGS if ch not in BAUDOT_LTRS
+)) + b']+)')
+
+# Decode tables indexed directly by 5-bit code (None where unassigned)
+LTRS_TUPLE = tuple(LTRS_DECODE.get(code) for code in range(32))
+FIGS_TUPLE = tuple(FIGS_DECODE.get(code) for code in range(32))
+
+# Byte translation tables for bulk decoding, built from the tuples,
+# with the codes each shift cannot print (in figures, codes with no
+# figure fall back to their letter; codes above 31 print nothing)
+_FIGS_OR_LTRS = tuple(f if f is not None else l for f, l in zip(FIGS_TUPLE, LTRS_TUPLE))
+_LTRS_DECODE_TABLE = bytes(ord(ch or '\0') for ch in LTRS_TUPLE).ljust(256, b'\0')
+_FIGS_DECODE_TABLE = bytes(ord(ch or '\0') for ch in _FIGS_OR_LTRS).ljust(256, b'\0')
+_LTRS_UNDECODABLE = bytes(
+    code for code in range(256) if code >= 32 or LTRS_TUPLE[code] is None
+)
+_FIGS_UNDECODABLE = bytes(
+    code for code in range(256) if code >= 32 or _FIGS_OR_LTRS[code] is None
+)
+
+# Shift codes, kept as separators when splitting a message into runs
+_SHIFT_CODE = re.compile(b'([' + re.escape(bytes([LTRS_SHIFT, FIGS_SHIFT])) + b'])')
+
 
 def text_to_baudot(text: str) -> List[int]:
     """
@@ -58,23 +95,56 @@ def text_to_baudot(text: str) -> List[int]:
 
     Status: [KNOWN] - Standard teleprinter encoding
     """
-    result = []
-    in_figures = False
+    return list(text_to_baudot_bytes(text))
+
+
+def text_to_baudot_bytes(text: str) -> bytes:
+    """
+    Convert ASCII text to Baudot/ITA2 codes, one code per byte.
+
+    Status: [KNOWN] - Standard teleprinter encoding
+    """
+    # Unknown characters silently dropped
+    raw = text.upper().encode('ascii', 'ignore').translate(None, _UNENCODABLE)
+
+    # Split into alternating letters/figures runs, shifting at each
+    # boundary; the first run is letters (possibly empty)
+    runs = _FIGS_RUN.split(raw)
+    result = bytearray(runs[0].translate(LTRS_TABLE))
+    for i in range(1, len(runs), 2):
+        result.append(FIGS_SHIFT)
+        result += runs[i].translate(FIGS_TABLE)
+        if runs[i + 1]:
+            result.append(LTRS_SHIFT)
+            result += runs[i + 1].translate(LTRS_TABLE)
+
+    return bytes(result)
 
-    for char in text.upper():
-        if char in BAUDOT_LTRS:
-            if in_figures:
-                result.append(LTRS_SHIFT)
-                in_figures = False
-            result.append(BAUDOT_LTRS[char])
-        elif char in BAUDOT_FIGS:
-            if not in_figures:
-                result.append(FIGS_SHIFT)
-                in_figures = True
-            result.append(BAUDOT_FIGS[char])
-        # Unknown characters silently dropped
 
-    return result
+# Longest text whose encoding is cached by text_to_baudot_cached()
+ENCODE_CACHE_MAX_LENGTH = 256
+
+_text_to_baudot_lru = lru_cache(maxsize=1024)(text_to_baudot_bytes)
+
+
+def text_to_baudot_cached(text: str) -> bytes:
+    """
+    Convert ASCII text to Baudot/ITA2 codes, caching short texts.
+
+    For the same headers and test messages encoded over and over. The
+    cache keeps the texts it is given, so do not pass plaintext you
+    would rather not have lying about; clear_baudot_cache() empties it.
+
+    Status: [KNOWN] - Standard teleprinter encoding
+    """
+    if len(text) > ENCODE_CACHE_MAX_LENGTH:
+        return text_to_baudot_bytes(text)
+    return _text_to_baudot_lru(text)
+
+
+def clear_baudot_cache():
+    """Forget every text held by text_to_baudot_cached()."""
+    _text_to_baudot_lru.cache_clear()
 
 
 def baudot_to_text(codes: List[int]) -> str:
@@ -83,23 +153,34 @@ def baudot_to_text(codes: List[int]) -> str:
 
     Status: [KNOWN] - Standard teleprinter encoding
     """
-    result = []
-    in_figures = False
-
-    for code in codes:
-        if code == LTRS_SHIFT:
-            in_figures = False
-        elif code == FIGS_SHIFT:
-            in_figures = True
-        elif code == 0x00:
-            pass  # NULL - ignore
+    # Materialise once so any iterable can be retried on the slow path
+    codes = list(codes)
+    try:
+        packed = bytes(codes)
+    except (ValueError, TypeError):
+        # Anything that is not a code 0-31 is not Baudot and prints nothing;
+        # integral values of other types (3.0) still decode as before
+        packed = bytes(int(code) for code in codes if code in range(32))
+    return baudot_bytes_to_text(packed)
+
+
+def baudot_bytes_to_text(codes: bytes) -> str:
+    """
+    Convert Baudot/ITA2 codes, one code per byte, to ASCII text.
+
+    Status: [KNOWN] - Standard teleprinter encoding
+    """
+    # Split into runs at each shift code; the first run is letters.
+    # NULL and other unprintable codes are dropped by the translation.
+    runs = _SHIFT_CODE.split(codes)
+    result = [runs[0].translate(_LTRS_DECODE_TABLE, _LTRS_UNDECODABLE)]
+    for i in range(1, len(runs), 2):
+        if runs[i][0] == FIGS_SHIFT:
+            result.append(runs[i + 1].translate(_FIGS_DECODE_TABLE, _FIGS_UNDECODABLE))
         else:
-            if in_figures and code in FIGS_DECODE:
-                result.append(FIGS_DECODE[code])
-            elif code in LTRS_DECODE:
-                result.append(LTRS_DECODE[code])
+            result.append(runs[i + 1].translate(_LTRS_DECODE_TABLE, _LTRS_UNDECODABLE))
 
-    return ''.join(result)
+    return b''.join(result).decode('ascii')
 
 
 # =============================================================================
@@ -108,7 +189,42 @@ def baudot_to_text(codes: List[int]) -> str:
 #         [RECONSTRUCTED] specific configuration
 # =============================================================================
 
-@dataclass
+# Number of clocks taken at once by LFSR.clock_bits() via lookup tables
+JUMP_STRIDE = 64
+
+
+@lru_cache(maxsize=16)
+def _jump_tables(length: int, tapmask: int, steps: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Precompute tables for clocking a Galois LFSR `steps` times at once.
+
+    Clocking is linear over GF(2), so the result for any state is the
+    XOR of the results for each of its set bits. Those per-bit results
+    are combined into one table per byte of the state, indexed by that
+    byte. Each entry packs the output bits above the new state:
+    (outputs << length) | state, first output most significant.
+    """
+    columns = []
+    for i in range(length):
+        state, outputs = 1 << i, 0
+        for _ in range(steps):
+            bit = state & 1
+            state = (state >> 1) ^ (-bit & tapmask)
+            outputs = (outputs << 1) | bit
+        columns.append((outputs << length) | state)
+
+    tables = []
+    for base in range(0, length, 8):
+        byte_columns = columns[base:base + 8]
+        table = [0] * (1 << len(byte_columns))
+        for index in range(1, len(table)):
+            lowest = index & -index
+            table[index] = table[index ^ lowest] ^ byte_columns[lowest.bit_length() - 1]
+        tables.append(tuple(table))
+    return tuple(tables)
+
+
+@dataclass(slots=True, repr=False)
 class LFSR:
     """
     A single Linear Feedback Shift Register.
@@ -116,43 +232,132 @@ class LFSR:
     The feedback polynomial determines which bits are XORed to produce
     the new input bit. We represent taps as a list of bit positions.
 
+    The register is clocked in Galois form: the feedback polynomial is
+    folded into a single tap mask that is XORed into the register
+    whenever a 1 is shifted out. This produces exactly the same output
+    sequence as the textbook Fibonacci form (feedback computed from the
+    taps and inserted at the left), but with one XOR per clock however
+    many taps there are. The `state` attribute (constructor argument,
+    repr and assignment alike) is always the Fibonacci register
+    contents, i.e. the next `length` output bits, rightmost first; it
+    is converted to and from the Galois value held in `_state`.
+
     Status: [KNOWN] - LFSR principle
             [RECONSTRUCTED] - Specific polynomials
     """
     length: int
     taps: List[int]  # Bit positions for feedback (0-indexed from right)
-    state: int = 0   # Current register state
+    state: InitVar[int] = 0  # Initial register contents (Fibonacci form)
 
-    def __post_init__(self):
+    # Galois register state, plus values derived from length and taps;
+    # slots keep attribute access cheap in the clocking hot path
+    _state: int = field(init=False, default=0)
+    mask: int = field(init=False)
+    tapmask: int = field(init=False)
+
+    def __post_init__(self, state: int):
         # Mask for register length
         self.mask = (1 << self.length) - 1
+        # Galois tap mask: Fibonacci tap t becomes bit (length - 1 - t)
+        self.tapmask = 0
+        for tap in self.taps:
+            self.tapmask |= 1 << (self.length - 1 - tap)
+
+        self._set_state(state)
+
+    def __repr__(self) -> str:
+        return f"LFSR(length={self.length}, taps={self.taps}, state={self.state})"
 
     def clock(self) -> int:
         """
         Clock the register once, return output bit.
 
-        The output bit is the rightmost bit.
-        The feedback bit is XOR of all tap positions.
+        The output bit is the rightmost bit. If it is set, the tap
+        mask is XORed into the shifted register (branchless).
         """
-        # Output bit (rightmost)
-        output = self.state & 1
-
-        # Calculate feedback bit (XOR of taps)
-        feedback = 0
-        for tap in self.taps:
-            feedback ^= (self.state >> tap) & 1
+        output = self._state & 1
+        self._state = (self._state >> 1) ^ (-output & self.tapmask)
+        return output
 
-        # Shift right, insert feedback at left
-        self.state = ((self.state >> 1) | (feedback << (self.length - 1))) & self.mask
+    def clock_bits(self, n: int) -> int:
+        """
+        Clock the register n times, return the output bits as an integer.
 
+        The first output bit is the most significant. Whole strides of
+        JUMP_STRIDE clocks are taken from precomputed tables, so the
+        cost is a handful of lookups per stride rather than per bit.
+        """
+        if n < 0:
+            raise ValueError("Number of clocks must be non-negative")
+
+        state = self._state
+        tapmask = self.tapmask
+        output = 0
+
+        if n >= JUMP_STRIDE:
+            length = self.length
+            mask = self.mask
+            tables = _jump_tables(length, tapmask, JUMP_STRIDE)
+            for _ in range(n // JUMP_STRIDE):
+                word = 0
+                for table in tables:
+                    word ^= table[state & 0xFF]
+                    state >>= 8
+                state = word & mask
+                output = (output << JUMP_STRIDE) | (word >> length)
+
+        for _ in range(n % JUMP_STRIDE):
+            bit = state & 1
+            state = (state >> 1) ^ (-bit & tapmask)
+            output = (output << 1) | bit
+
+        self._state = state
         return output
 
     def load(self, initial_state: int):
-        """Load initial state (from cryptovariable)."""
-        self.state = initial_state & self.mask
+        """
+        Load initial state (from cryptovariable).
+
+        The value is the Fibonacci register contents, i.e. the next
+        `length` output bits, rightmost first. It is converted to the
+        equivalent Galois state before clocking.
+        """
+        state = initial_state & self.mask
         # Ensure non-zero state (all-zeros locks LFSR)
-        if self.state == 0:
-            self.state = 1
+        if state == 0:
+            state = 1
+        self._state = self._to_galois(state)
+
+    def _get_state(self) -> int:
+        """Return the register contents in Fibonacci form."""
+        # The next `length` output bits, rightmost first
+        state = self._state
+        tapmask = self.tapmask
+        contents = 0
+        for i in range(self.length):
+            bit = state & 1
+            state = (state >> 1) ^ (-bit & tapmask)
+            contents |= bit << i
+        return contents
+
+    def _set_state(self, contents: int):
+        """Set the register from Fibonacci contents (no zero check)."""
+        self._state = self._to_galois(contents & self.mask)
+
+    def _to_galois(self, contents: int) -> int:
+        """Convert Fibonacci register contents to the Galois state."""
+        # Galois bit k is Fibonacci bit k, corrected for every earlier
+        # output that has fed back into it through a tap
+        galois = contents
+        for tap in self.taps:
+            galois ^= (contents << (self.length - tap)) & self.mask
+        return galois
+
+
+# Attached after the class so the dataclass sees `state` as an InitVar
+# with a default, while reads and writes go through the Galois state
+LFSR.state = property(LFSR._get_state, LFSR._set_state,
+                      doc="Register contents in Fibonacci form.")
 
 
 # =============================================================================
@@ -169,6 +374,10 @@ def majority_combine(a: int, b: int, c: int) -> int:
     Rationale: Majority function was known in 1950s, provides
     correlation immunity, simple to implement with vacuum tubes.
 
+    Works bitwise, so packed multi-bit integers combine every bit
+    position at once. Single-bit hot paths use the equivalent
+    ((a + b + c) >> 1) ^ c, which does not extend to packed bits.
+
     See DEVIATIONS.md section 2.1 for full rationale.
     """
     # Majority: output 1 if 2 or more inputs are 1
@@ -177,6 +386,31 @@ def majority_combine(a: int, b: int, c: int) -> int:
     return majority ^ c
 
 
+def _keystream_bits(state_a: int, state_b: int, state_c: int,
+                    tapmask_a: int, tapmask_b: int, tapmask_c: int,
+                    n: int) -> Tuple[int, int, int, int]:
+    """
+    Clock three Galois LFSRs n times and combine their outputs.
+
+    The bit-serial keystream kernel: integer operations on locals
+    only, with no method calls or attribute lookups per bit.
+
+    Returns:
+        (state_a, state_b, state_c, bits) - the new register states and
+        the n keystream bits, first bit most significant
+    """
+    bits = 0
+    for _ in range(n):
+        a = state_a & 1
+        state_a = (state_a >> 1) ^ (-a & tapmask_a)
+        b = state_b & 1
+        state_b = (state_b >> 1) ^ (-b & tapmask_b)
+        c = state_c & 1
+        state_c = (state_c >> 1) ^ (-c & tapmask_c)
+        bits = (bits << 1) | (((a + b + c) >> 1) ^ c)
+    return state_a, state_b, state_c, bits
+
+
 # =============================================================================
 # KW-26 CIPHER
 # =============================================================================
@@ -195,6 +429,32 @@ LFSR_CONFIGS = [
     (23, [0, 5]),
 ]
 
+# Baudot codes encrypted per bulk keystream request (a power of two)
+ENCRYPT_BLOCK = 64
+
+
+def _spread_masks(fields: int) -> Tuple[Tuple[int, int, int], ...]:
+    """
+    Build the steps that spread packed 5-bit fields to one per byte.
+
+    Each step moves the upper half of every group of fields up by 3
+    bits per field, halving the group size until each field sits at
+    the bottom of its own byte. Steps are (keep, move, shift) masks.
+    """
+    steps = []
+    group = fields // 2
+    while group:
+        move = 0
+        for start in range(0, fields * 8, group * 16):
+            move |= ((1 << (5 * group)) - 1) << (start + 5 * group)
+        keep = ((1 << (fields * 8)) - 1) ^ move
+        steps.append((keep, move, 3 * group))
+        group //= 2
+    return tuple(steps)
+
+
+_SPREAD_STEPS = _spread_masks(ENCRYPT_BLOCK)
+
 
 class KW26:
     """
@@ -243,6 +503,9 @@ class KW26:
         self.lfsrs[1].load(0x12345678)  # 29-bit
         self.lfsrs[2].load(0x00ABCDEF)  # 23-bit
 
+        # Remember the loaded states so reset() need not reload
+        self._init_states = tuple(lfsr._state for lfsr in self.lfsrs)
+
     def _load_cryptovariable(self, cv: bytes):
         """
         Load cryptovariable from punch card data.
@@ -262,10 +525,10 @@ class KW26:
 
         # Extract LFSR initial states
         # LFSR-A: 31 bits from bytes 0-3 (use low 31 bits)
-        state_a = struct.unpack('>I', cv[0:4])[0] & 0x7FFFFFFF
+        state_a = int.from_bytes(cv[0:4], 'big') & 0x7FFFFFFF
 
         # LFSR-B: 29 bits from bytes 4-7 (use low 29 bits)
-        state_b = struct.unpack('>I', cv[4:8])[0] & 0x1FFFFFFF
+        state_b = int.from_bytes(cv[4:8], 'big') & 0x1FFFFFFF
 
         # LFSR-C: 23 bits from bytes 8-10 (use low 23 bits)
         state_c = (cv[8] << 16) | (cv[9] << 8) | cv[10]
@@ -275,6 +538,9 @@ class KW26:
         self.lfsrs[1].load(state_b)
         self.lfsrs[2].load(state_c)
 
+        # Remember the loaded states so reset() need not parse cv again
+        self._init_states = tuple(lfsr._state for lfsr in self.lfsrs)
+
     def generate_keystream_bit(self) -> int:
         """
         Generate one bit of keystream.
@@ -286,21 +552,71 @@ class KW26:
             Single keystream bit (0 or 1)
         """
         # Clock all LFSRs and get output bits
-        bits = [lfsr.clock() for lfsr in self.lfsrs]
+        # (LFSR.clock() inlined: this runs once per keystream bit)
+        lfsr_a, lfsr_b, lfsr_c = self.lfsrs
+        state = lfsr_a._state
+        bit_a = state & 1
+        lfsr_a._state = (state >> 1) ^ (-bit_a & lfsr_a.tapmask)
+        state = lfsr_b._state
+        bit_b = state & 1
+        lfsr_b._state = (state >> 1) ^ (-bit_b & lfsr_b.tapmask)
+        state = lfsr_c._state
+        bit_c = state & 1
+        lfsr_c._state = (state >> 1) ^ (-bit_c & lfsr_c.tapmask)
 
         # Combine nonlinearly
         # Status: [RECONSTRUCTED] - See DEVIATIONS.md section 2.1
-        output = majority_combine(bits[0], bits[1], bits[2])
+        # (For single bits, the sum is 2 or 3 exactly when the majority is 1)
+        output = ((bit_a + bit_b + bit_c) >> 1) ^ bit_c
 
         self.keystream_position += 1
         return output
 
+    def generate_keystream_bits(self, n: int) -> int:
+        """
+        Generate n bits of keystream at once.
+
+        Whole strides of JUMP_STRIDE clocks are taken in bulk from each
+        LFSR and the packed outputs combined in a single bitwise
+        operation; any remainder goes through the bit-serial kernel.
+
+        Returns:
+            The keystream bits as an integer, first bit most significant
+        """
+        if n < 0:
+            raise ValueError("Number of keystream bits must be non-negative")
+
+        tail = n % JUMP_STRIDE
+        output = 0
+        if n > tail:
+            bits = [lfsr.clock_bits(n - tail) for lfsr in self.lfsrs]
+            output = majority_combine(bits[0], bits[1], bits[2])
+
+        lfsr_a, lfsr_b, lfsr_c = self.lfsrs
+        lfsr_a._state, lfsr_b._state, lfsr_c._state, tail_bits = _keystream_bits(
+            lfsr_a._state, lfsr_b._state, lfsr_c._state,
+            lfsr_a.tapmask, lfsr_b.tapmask, lfsr_c.tapmask,
+            tail,
+        )
+        output = (output << tail) | tail_bits
+
+        self.keystream_position += n
+        return output
+
     def generate_keystream_byte(self) -> int:
         """Generate 8 bits of keystream as a byte."""
-        byte = 0
-        for i in range(8):
-            byte = (byte << 1) | self.generate_keystream_bit()
-        return byte
+        return self.generate_keystream_bits(8)
+
+    def generate_keystream_bytes(self, nbytes: int) -> bytes:
+        """
+        Generate nbytes bytes of keystream.
+
+        Equivalent to calling generate_keystream_byte() nbytes times,
+        but produced in bulk.
+        """
+        if nbytes < 0:
+            raise ValueError("Number of keystream bytes must be non-negative")
+        return self.generate_keystream_bits(8 * nbytes).to_bytes(nbytes, 'big')
 
     def encrypt_baudot(self, plaintext_codes: List[int]) -> List[int]:
         """
@@ -314,19 +630,45 @@ class KW26:
         Returns:
             List of encrypted 5-bit codes
         """
-        ciphertext = []
-        for code in plaintext_codes:
-            # Generate 5 keystream bits
-            key_bits = 0
-            for _ in range(5):
-                key_bits = (key_bits << 1) | self.generate_keystream_bit()
+        # Materialise once so any iterable can be retried on the slow path
+        codes = list(plaintext_codes)
+        try:
+            packed = bytes(codes)
+        except ValueError:
+            # Codes that do not fit in a byte: the keystream only touches
+            # the low 5 bits, so encrypt those and keep the rest as given
+            low_bits = self.encrypt_baudot_bytes(bytes(code & 0x1F for code in codes))
+            return [(code & ~0x1F) | low for code, low in zip(codes, low_bits)]
+        return list(self.encrypt_baudot_bytes(packed))
+
+    def encrypt_baudot_bytes(self, plaintext_codes: bytes) -> bytes:
+        """
+        Encrypt Baudot codes held one per byte.
+
+        Status: [KNOWN] - XOR with keystream
+
+        Args:
+            plaintext_codes: 5-bit Baudot codes as bytes or bytearray
+
+        Returns:
+            Encrypted 5-bit codes as bytes
+        """
+        ciphertext = bytearray()
+        for start in range(0, len(plaintext_codes), ENCRYPT_BLOCK):
+            block = plaintext_codes[start:start + ENCRYPT_BLOCK]
 
-            # XOR plaintext with keystream
+            # Generate 5 keystream bits per code, then spread them so
+            # each code's key lines up with its byte in the block
+            key_bits = self.generate_keystream_bits(5 * len(block))
+            for keep, move, shift in _SPREAD_STEPS:
+                key_bits = (key_bits & keep) | ((key_bits & move) << shift)
+
+            # XOR plaintext with keystream, whole block at once
             # Status: [KNOWN] - Explicitly documented
-            encrypted = code ^ key_bits
-            ciphertext.append(encrypted)
+            encrypted = int.from_bytes(block, 'big') ^ key_bits
+            ciphertext += encrypted.to_bytes(len(block), 'big')
 
-        return ciphertext
+        return bytes(ciphertext)
 
     def decrypt_baudot(self, ciphertext_codes: List[int]) -> List[int]:
         """
@@ -339,6 +681,14 @@ class KW26:
         # XOR is its own inverse
         return self.encrypt_baudot(ciphertext_codes)
 
+    def decrypt_baudot_bytes(self, ciphertext_codes: bytes) -> bytes:
+        """
+        Decrypt Baudot codes held one per byte.
+
+        Status: [KNOWN] - XOR is symmetric
+        """
+        return self.encrypt_baudot_bytes(ciphertext_codes)
+
     def encrypt(self, plaintext: str) -> List[int]:
         """
         Encrypt ASCII text to encrypted Baudot codes.
@@ -349,8 +699,8 @@ class KW26:
         Returns:
             List of encrypted 5-bit Baudot codes
         """
-        baudot = text_to_baudot(plaintext)
-        return self.encrypt_baudot(baudot)
+        # Codes stay packed in bytes from encoding through encryption
+        return list(self.encrypt_baudot_bytes(text_to_baudot_bytes(plaintext)))
 
     def decrypt(self, ciphertext: List[int]) -> str:
         """
@@ -362,16 +712,27 @@ class KW26:
         Returns:
             Decrypted ASCII text
         """
-        baudot = self.decrypt_baudot(ciphertext)
-        return baudot_to_text(baudot)
+        codes = list(ciphertext)
+        try:
+            packed = bytes(codes)
+        except ValueError:
+            # Codes that do not fit in a byte take the list path
+            return baudot_to_text(self.decrypt_baudot(codes))
+        return baudot_bytes_to_text(self.decrypt_baudot_bytes(packed))
 
     def reset(self, cryptovariable: bytes = None):
-        """Reset the cipher to initial state."""
+        """
+        Reset the cipher to initial state.
+
+        With a cryptovariable, loads that key. Without one, returns to
+        the key currently loaded, restoring its cached register states.
+        """
         self.keystream_position = 0
         if cryptovariable:
             self._load_cryptovariable(cryptovariable)
         else:
-            self._load_test_key()
+            for lfsr, state in zip(self.lfsrs, self._init_states):
+                lfsr._state = state
 
     def get_state(self) -> dict:
         """Return current cipher state for debugging."""
@@ -462,10 +823,10 @@ def demo():
     cipher = KW26()
 
     # Generate some keystream
-    keystream = [cipher.generate_keystream_bit() for _ in range(100)]
-    ones = sum(keystream)
+    keystream = cipher.generate_keystream_bits(100)
+    ones = keystream.bit_count()
     print(f"First 100 bits: {ones} ones, {100-ones} zeros")
-    print(f"Bits: {''.join(str(b) for b in keystream[:50])}...")
+    print(f"Bits: {keystream >> 50:050b}...")
 
     print("\n--- LFSR States ---")
     state = cipher.get_state()
@@ -493,6 +854,12 @@ def cli():
     import argparse
     import sys
 
+    def positive_int(value):
+        number = int(value)
+        if number <= 0:
+            raise argparse.ArgumentTypeError(f"must be a positive integer, not {value}")
+        return number
+
     parser = argparse.ArgumentParser(
         description='KW-26 ROMULUS - A Plausible Reconstruction',
         epilog='This is NOT the actual KW-26 algorithm. Obviously.'
@@ -518,7 +885,7 @@ def cli():
 
     # keystream command
     ks_parser = subparsers.add_parser('keystream', help='Generate raw keystream bits')
-    ks_parser.add_argument('--bits', '-n', type=int, default=100, help='Number of bits (default: 100)')
+    ks_parser.add_argument('--bits', '-n', type=positive_int, default=100, help='Number of bits (default: 100)')
     ks_parser.add_argument('--key', '-k', help='Hex key (32 chars)')
 
     args = parser.parse_args()
@@ -560,10 +927,10 @@ def cli():
 
     elif args.command == 'keystream':
         cipher = get_cipher(getattr(args, 'key', None))
-        bits = [cipher.generate_keystream_bit() for _ in range(args.bits)]
+        bits = cipher.generate_keystream_bits(args.bits)
         print(f"Keystream ({args.bits} bits):")
-        print(''.join(str(b) for b in bits))
-        ones = sum(bits)
+        print(f"{bits:0{args.bits}b}")
+        ones = bits.bit_count()
         print(f"\nDistribution: {ones} ones, {args.bits - ones} zeros ({100*ones/args.bits:.1f}% ones)")
 
     elif args.command == 'demo':
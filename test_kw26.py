@@ -3,11 +3,15 @@
 Test suite for KW-26 ROMULUS reconstruction.
 """
 
+import dataclasses
 import unittest
+import kw26
 from kw26 import (
     KW26, LFSR,
     text_to_baudot, baudot_to_text,
-    majority_combine, generate_cryptovariable
+    text_to_baudot_bytes, baudot_bytes_to_text,
+    majority_combine, generate_cryptovariable,
+    LTRS_SHIFT, FIGS_SHIFT
 )
 
 
@@ -42,6 +46,56 @@ class TestBaudot(unittest.TestCase):
         result = baudot_to_text(baudot)
         self.assertEqual(result, text)
 
+    def test_shift_codes(self):
+        """Test shift placement and dropping of unknown characters."""
+        # Space after figures is sent in letters; '@' has no code
+        self.assertEqual(
+            text_to_baudot("a1 @b"),
+            [0x03, FIGS_SHIFT, 0x17, LTRS_SHIFT, 0x04, 0x19],
+        )
+
+    def test_bytes_api(self):
+        """Test that the bytes functions match the list functions."""
+        text = "TEST 123 ABC 456"
+        baudot = text_to_baudot_bytes(text)
+        self.assertIsInstance(baudot, bytes)
+        self.assertEqual(list(baudot), text_to_baudot(text))
+        self.assertEqual(baudot_bytes_to_text(baudot), text)
+        self.assertEqual(baudot_bytes_to_text(bytearray(baudot)), text)
+
+    def test_encode_cache(self):
+        """Test that only text_to_baudot_cached() keeps texts, and can forget them."""
+        kw26.clear_baudot_cache()
+        cache_info = kw26._text_to_baudot_lru.cache_info
+
+        KW26().encrypt("SECRET MESSAGE")
+        text_to_baudot("SECRET MESSAGE")
+        text_to_baudot_bytes("SECRET MESSAGE")
+        self.assertEqual(cache_info().currsize, 0)
+
+        long_text = "TEST 123 " * 50
+        self.assertEqual(kw26.text_to_baudot_cached(long_text), text_to_baudot_bytes(long_text))
+        self.assertEqual(cache_info().currsize, 0)
+
+        self.assertEqual(kw26.text_to_baudot_cached("HELLO"), text_to_baudot_bytes("HELLO"))
+        kw26.text_to_baudot_cached("HELLO")
+        self.assertEqual(cache_info().hits, 1)
+
+        kw26.clear_baudot_cache()
+        self.assertEqual(cache_info().currsize, 0)
+
+    def test_decode_shifts(self):
+        """Test decoding across shifts, NULLs and letter fallback."""
+        # 0x05 has no figure and decodes as its letter; NULL is ignored
+        codes = [0x03, FIGS_SHIFT, 0x17, 0x05, 0x00, LTRS_SHIFT, 0x17]
+        self.assertEqual(baudot_to_text(codes), "A1SQ")
+
+    def test_decode_out_of_range(self):
+        """Test that codes outside 0-31 are ignored, not rejected."""
+        self.assertEqual(baudot_to_text([300, 0x03, -5, 40]), "A")
+        self.assertEqual(baudot_to_text(iter([0x03, 300])), "A")
+        self.assertEqual(baudot_to_text([3.0, None]), "A")
+
 
 class TestLFSR(unittest.TestCase):
     """Test LFSR implementation."""
@@ -76,6 +130,90 @@ class TestLFSR(unittest.TestCase):
         for _ in range(100):
             self.assertEqual(lfsr1.clock(), lfsr2.clock())
 
+    def test_lfsr_equality(self):
+        """Test that registers compare by configuration and state."""
+        self.assertEqual(LFSR(length=5, taps=[0, 2]), LFSR(length=5, taps=[0, 2]))
+        self.assertNotEqual(LFSR(length=5, taps=[0, 2], state=6),
+                            LFSR(length=5, taps=[0, 2], state=7))
+
+    def test_lfsr_state_round_trip(self):
+        """Test that repr, replace and assignment share one state form."""
+        lfsr = LFSR(length=5, taps=[0, 2])
+        lfsr.load(6)
+
+        self.assertEqual(repr(lfsr), "LFSR(length=5, taps=[0, 2], state=6)")
+        self.assertEqual(eval(repr(lfsr)), lfsr)
+        self.assertEqual(dataclasses.replace(lfsr), lfsr)
+
+        # Assigning state behaves like the constructor argument
+        other = LFSR(length=5, taps=[0, 2])
+        other.state = 6
+        self.assertEqual(other, lfsr)
+        self.assertEqual([other.clock() for _ in range(10)],
+                         [lfsr.clock() for _ in range(10)])
+
+    def test_lfsr_matches_fibonacci(self):
+        """Test that the Galois register matches the Fibonacci form."""
+        # Same polynomial as test_lfsr_period: x^5 + x^2 + 1
+        length, taps = 5, [0, 2]
+
+        for initial in range(1, 32):
+            lfsr = LFSR(length=length, taps=taps)
+            lfsr.load(initial)
+
+            # Reference Fibonacci register: XOR taps, insert at left
+            state = initial
+            for _ in range(62):
+                expected = state & 1
+                feedback = 0
+                for tap in taps:
+                    feedback ^= (state >> tap) & 1
+                state = (state >> 1) | (feedback << (length - 1))
+
+                self.assertEqual(lfsr.clock(), expected)
+
+    def test_lfsr_initial_state(self):
+        """Test that a constructor state is Fibonacci contents, like load()."""
+        lfsr1 = LFSR(length=5, taps=[0, 2], state=6)
+        lfsr2 = LFSR(length=5, taps=[0, 2])
+        lfsr2.load(6)
+
+        self.assertEqual(lfsr1.state, 6)
+        bits = [lfsr1.clock() for _ in range(10)]
+        self.assertEqual(bits, [lfsr2.clock() for _ in range(10)])
+        # Same sequence as the Fibonacci register loaded with 0b00110
+        self.assertEqual(bits, [0, 1, 1, 0, 0, 1, 1, 1, 1, 1])
+
+    def test_lfsr_state_contents(self):
+        """Test that state is the next length output bits."""
+        lfsr = LFSR(length=31, taps=[0, 3])
+        lfsr.load(0x12345678)
+        self.assertEqual(lfsr.state, 0x12345678)
+
+        for _ in range(50):
+            lfsr.clock()
+        contents = lfsr.state
+        for i in range(31):
+            self.assertEqual(lfsr.clock(), (contents >> i) & 1)
+
+    def test_lfsr_clock_bits(self):
+        """Test that bulk clocking matches single clocks."""
+        for n in (0, 1, 5, 63, 64, 65, 200):
+            lfsr1 = LFSR(length=31, taps=[0, 3])
+            lfsr2 = LFSR(length=31, taps=[0, 3])
+            lfsr1.load(0x12345678)
+            lfsr2.load(0x12345678)
+
+            expected = 0
+            for _ in range(n):
+                expected = (expected << 1) | lfsr2.clock()
+
+            self.assertEqual(lfsr1.clock_bits(n), expected)
+            self.assertEqual(lfsr1.state, lfsr2.state)
+
+        with self.assertRaises(ValueError):
+            lfsr1.clock_bits(-1)
+
 
 class TestCombiner(unittest.TestCase):
     """Test combining function."""
@@ -89,6 +227,23 @@ class TestCombiner(unittest.TestCase):
         # Majority of (1,1,0) = 1, XOR 0 = 1
         self.assertEqual(majority_combine(1, 1, 0), 1)
 
+        # Full truth table, against the arithmetic single-bit form
+        for a in (0, 1):
+            for b in (0, 1):
+                for c in (0, 1):
+                    self.assertEqual(majority_combine(a, b, c),
+                                     ((a + b + c) >> 1) ^ c)
+
+    def test_majority_packed(self):
+        """Test majority function on packed multi-bit inputs."""
+        # Each bit position is one row of the truth table
+        a, b, c = 0b00001111, 0b00110011, 0b01010101
+        expected = 0
+        for i in range(8):
+            bits = ((a >> i) & 1, (b >> i) & 1, (c >> i) & 1)
+            expected |= majority_combine(*bits) << i
+        self.assertEqual(majority_combine(a, b, c), expected)
+
 
 class TestKW26(unittest.TestCase):
     """Test KW-26 cipher."""
@@ -104,6 +259,19 @@ class TestKW26(unittest.TestCase):
 
         self.assertEqual(decrypted.strip(), plaintext.strip())
 
+    def test_encrypt_decrypt_bytes(self):
+        """Test bytes encrypt/decrypt against the list versions."""
+        cipher1 = KW26()
+        cipher2 = KW26()
+        cipher_rx = KW26()
+
+        baudot = text_to_baudot_bytes("SECRET MESSAGE 42")
+        ciphertext = cipher1.encrypt_baudot_bytes(baudot)
+
+        self.assertIsInstance(ciphertext, bytes)
+        self.assertEqual(list(ciphertext), cipher2.encrypt_baudot(list(baudot)))
+        self.assertEqual(cipher_rx.decrypt_baudot_bytes(bytearray(ciphertext)), baudot)
+
     def test_different_keys(self):
         """Test that different keys produce different ciphertext."""
         cv1 = generate_cryptovariable()
@@ -141,6 +309,94 @@ class TestKW26(unittest.TestCase):
 
         self.assertEqual(cipher.keystream_position, 100)
 
+    def test_keystream_bits(self):
+        """Test that bulk keystream matches bit-at-a-time keystream."""
+        cipher1 = KW26()
+        cipher2 = KW26()
+
+        for n in (1, 5, 64, 300):
+            expected = 0
+            for _ in range(n):
+                expected = (expected << 1) | cipher2.generate_keystream_bit()
+
+            self.assertEqual(cipher1.generate_keystream_bits(n), expected)
+            self.assertEqual(cipher1.keystream_position,
+                             cipher2.keystream_position)
+
+    def test_keystream_negative(self):
+        """Test that negative keystream lengths are rejected."""
+        cipher = KW26()
+        state = cipher.get_state()
+
+        with self.assertRaises(ValueError):
+            cipher.generate_keystream_bits(-3)
+        with self.assertRaises(ValueError):
+            cipher.generate_keystream_bytes(-1)
+
+        self.assertEqual(cipher.get_state(), state)
+
+    def test_keystream_bytes(self):
+        """Test that bulk keystream bytes match single bytes."""
+        cipher1 = KW26()
+        cipher2 = KW26()
+
+        expected = bytes(cipher2.generate_keystream_byte() for _ in range(100))
+        self.assertEqual(cipher1.generate_keystream_bytes(100), expected)
+        self.assertEqual(cipher1.keystream_position, 800)
+
+    def test_encrypt_baudot_blocks(self):
+        """Test block encryption against bit-at-a-time keystream."""
+        cipher1 = KW26()
+        cipher2 = KW26()
+
+        # Longer than one block, not a whole number of blocks
+        codes = [i % 32 for i in range(150)]
+
+        expected = []
+        for code in codes:
+            key_bits = 0
+            for _ in range(5):
+                key_bits = (key_bits << 1) | cipher2.generate_keystream_bit()
+            expected.append(code ^ key_bits)
+
+        self.assertEqual(cipher1.encrypt_baudot(codes), expected)
+
+    def test_get_state(self):
+        """Test that get_state reports the loaded register contents."""
+        cipher = KW26()
+        self.assertEqual(
+            cipher.get_state(),
+            {'position': 0, 'lfsr_states': [0x5A5A5A5A & 0x7FFFFFFF,
+                                            0x12345678 & 0x1FFFFFFF,
+                                            0x00ABCDEF & 0x7FFFFF]},
+        )
+
+    def test_decrypt_out_of_range(self):
+        """Test that decrypt ignores codes outside 0-31."""
+        ciphertext = KW26().encrypt("HI")
+        self.assertEqual(KW26().decrypt(ciphertext + [300]), "HI")
+
+    def test_encrypt_baudot_out_of_range(self):
+        """Test that codes outside a byte are still XORed, not rejected."""
+        cipher = KW26()
+        keys = KW26().encrypt_baudot([0, 0, 0, 0])
+
+        codes = [256, -1, 3, 1000]
+        self.assertEqual(
+            cipher.encrypt_baudot(codes),
+            [code ^ key for code, key in zip(codes, keys)],
+        )
+        self.assertEqual(cipher.keystream_position, 20)
+
+    def test_iterable_input(self):
+        """Test that generators are read once, even on the slow path."""
+        keys = KW26().encrypt_baudot([0, 0])
+        self.assertEqual(KW26().encrypt_baudot(iter([1, 300])),
+                         [1 ^ keys[0], 300 ^ keys[1]])
+
+        ciphertext = KW26().encrypt("HI")
+        self.assertEqual(KW26().decrypt(iter(ciphertext + [300])), "HI")
+
     def test_reset(self):
         """Test cipher reset."""
         cipher = KW26()
@@ -156,6 +412,23 @@ class TestKW26(unittest.TestCase):
 
         self.assertEqual(bits1, bits2)
 
+    def test_reset_keeps_key(self):
+        """Test that reset without a key returns to the loaded key."""
+        cv = generate_cryptovariable()
+        cipher = KW26(cv)
+
+        bits1 = [cipher.generate_keystream_bit() for _ in range(50)]
+        cipher.reset()
+        bits2 = [cipher.generate_keystream_bit() for _ in range(50)]
+
+        self.assertEqual(bits1, bits2)
+        self.assertEqual(cipher.keystream_position, 50)
+
+        # Reset with a new key switches to it
+        other = generate_cryptovariable()
+        cipher.reset(other)
+        self.assertEqual(cipher.get_state(), KW26(other).get_state())
+
 
 class TestTrafficFlowSecurity(unittest.TestCase):
     """Test traffic flow security property."""